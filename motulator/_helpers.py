@@ -2,8 +2,12 @@
 
 # %%
 from dataclasses import dataclass
+import math
 import numpy as np
 
+_SQRT3 = math.sqrt(3)
+_INV_SQRT3 = 1/_SQRT3
+
 
 # %%
 def abc2complex(u):
@@ -28,7 +32,38 @@ def abc2complex(u):
     (-1-0.5773502691896258j)
 
     """
-    return (2/3)*u[0] - (u[1] + u[2])/3 + 1j*(u[1] - u[2])/np.sqrt(3)
+    # The zero-sequence component cancels out exactly in this form
+    return (2*u[0] - u[1] - u[2])/3 + 1j*_INV_SQRT3*(u[1] - u[2])
+
+
+# %%
+def abc2complex_scalar(u_a, u_b, u_c):
+    """
+    Transform scalar three-phase quantities to a complex space vector.
+
+    This is a lightweight version of `abc2complex` for Python scalars, intended 
+    for the discrete-time control loops, where the overhead of NumPy 
+    operations on single values is significant.
+
+    Parameters
+    ----------
+    u_a, u_b, u_c : float
+        Phase quantities.
+
+    Returns
+    -------
+    complex
+        Complex space vector (peak-value scaling).
+
+    Examples
+    --------
+    >>> from motulator._helpers import abc2complex_scalar
+    >>> y = abc2complex_scalar(1, 2, 3)
+    >>> y
+    (-1-0.5773502691896258j)
+
+    """
+    return complex((2*u_a - u_b - u_c)/3, (u_b - u_c)*_INV_SQRT3)
 
 
 # %%
@@ -54,10 +89,33 @@ def complex2abc(u):
     array([ 1.       , -0.9330127, -0.0669873])
 
     """
-    return np.array([
-        u.real, .5*(-u.real + np.sqrt(3)*u.imag),
-        .5*(-u.real - np.sqrt(3)*u.imag)
-    ])
+    return np.array(
+        [u.real, .5*(-u.real + _SQRT3*u.imag), .5*(-u.real - _SQRT3*u.imag)])
+
+
+# %%
+def _wrap_pi(x, out=None):
+    """
+    Limit angles into [-pi, pi).
+
+    Parameters
+    ----------
+    x : ndarray
+        Angles (rad).
+    out : ndarray, optional
+        Array where the result is stored. It can be `x` itself for in-place 
+        operation. By default, a new array is allocated.
+
+    Returns
+    -------
+    ndarray
+        Angles (rad) in [-pi, pi).
+
+    """
+    out = np.add(x, np.pi, out=out)
+    np.mod(out, 2*np.pi, out=out)
+    out -= np.pi
+    return out
 
 
 # %%
@@ -1,5 +1,6 @@
 """Common control functions and classes."""
 
+import math
 import numpy as np
 from motulator._helpers import abc2complex, complex2abc
 from motulator._utils import Bunch
@@ -166,9 +167,12 @@ class PWM:
         # Advance the angle due to the computational delay (T_s) and the ZOH
         # (PWM) delay (0.5*T_s)
         theta_comp = theta + 1.5*T_s*w
+        cos_theta, sin_theta = math.cos(theta_comp), math.sin(theta_comp)
 
         # Voltage reference in stator coordinates
-        u_s_ref = np.exp(1j*theta_comp)*u_ref
+        u_s_ref = complex(
+            cos_theta*u_ref.real - sin_theta*u_ref.imag,
+            sin_theta*u_ref.real + cos_theta*u_ref.imag)
 
         # Modify angle in the overmodulation region
         if self.six_step:
@@ -179,7 +183,9 @@ class PWM:
 
         # Realizable voltage
         u_s_ref_lim = abc2complex(d_abc)*u_dc
-        u_ref_lim = np.exp(-1j*theta_comp)*u_s_ref_lim
+        u_ref_lim = complex(
+            cos_theta*u_s_ref_lim.real + sin_theta*u_s_ref_lim.imag,
+            cos_theta*u_s_ref_lim.imag - sin_theta*u_s_ref_lim.real)
 
         # Update the voltage estimate for the next sampling instant.
         self.realized_voltage = .5*(self._u_ref_lim_old + u_ref_lim)
@@ -478,13 +484,23 @@ class RateLimiter:
 # %%
 class Clock:
     """Digital clock.
+
+    The time is computed from an integer step counter as ``t = t_0 + k*T_s`` 
+    instead of accumulating the sampling periods, which would accumulate 
+    rounding errors in long simulations. If the sampling period changes, the 
+    current time is taken as the new starting time `t_0`.
     
     """
 
     def __init__(self):
-        self.t = 0
+        self._k, self._T_s, self._t0 = 0, 0, 0
         self.t_reset = 1e9
 
+    @property
+    def t(self):
+        """Current time (s)."""
+        return self._t0 + self._k*self._T_s
+
     def update(self, T_s):
         """
         Update the digital clock.
@@ -495,7 +511,32 @@ class Clock:
             Sampling period (s).
 
         """
-        self.t += T_s if self.t < self.t_reset else 0
+        if self.t < self.t_reset:
+            if T_s != self._T_s:
+                self._t0, self._k, self._T_s = self.t, 0, T_s
+            self._k += 1
+
+    def sampling_instants(self, T_s, n_steps):
+        """
+        Compute the upcoming sampling instants.
+
+        Parameters
+        ----------
+        T_s : float
+            Sampling period (s).
+        n_steps : int
+            Number of sampling instants.
+
+        Returns
+        -------
+        t : ndarray, shape (n_steps,)
+            Sampling instants (s), starting from the current time and matching 
+            the times given by the clock when updated with `T_s`.
+
+        """
+        if T_s == self._T_s:
+            return self._t0 + (self._k + np.arange(n_steps))*T_s
+        return self.t + np.arange(n_steps)*T_s
 
 
 # %%
@@ -535,7 +576,7 @@ class Ctrl:
 
         """
         for key, value in data.items():
-            self.data.setdefault(key, []).extend([value])
+            self.data.setdefault(key, []).append(value)
 
     def post_process(self):
         """
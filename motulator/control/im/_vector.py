@@ -6,7 +6,7 @@ The algorithms are written based on the inverse-Γ model.
 """
 from dataclasses import dataclass, InitVar
 import numpy as np
-from motulator._helpers import abc2complex
+from motulator._helpers import abc2complex, _INV_SQRT3
 from motulator.control._common import PWM, Ctrl, ComplexPICtrl, SpeedCtrl
 from motulator._utils import Bunch
 
@@ -288,6 +288,7 @@ class CurrentReference:
         # Other parameters
         self.i_s_max = ref.i_s_max
         self.k_u = ref.k_u
+        self._k_u_inv_sqrt3 = self.k_u*_INV_SQRT3
         # Field-weakening gain
         self.k_fw = ref.k_fw
         # Nominal d-axis current
@@ -353,7 +354,7 @@ class CurrentReference:
             DC-bus voltage (V).
 
         """
-        u_s_max = self.k_u*u_dc/np.sqrt(3)
+        u_s_max = self._k_u_inv_sqrt3*u_dc
         self.i_sd_ref += T_s*self.k_fw*(u_s_max - np.abs(u_s_ref))
         self.i_sd_ref = np.clip(self.i_sd_ref, -self.i_s_max, self.i_sd_nom)
 
@@ -4,7 +4,7 @@
 
 from dataclasses import dataclass, InitVar
 import numpy as np
-from motulator._helpers import abc2complex
+from motulator._helpers import abc2complex, _INV_SQRT3
 from motulator.control._common import Ctrl, PWM, SpeedCtrl
 from motulator.control.sm._torque import TorqueCharacteristics
 from motulator.control.sm._vector import Observer, ModelPars
@@ -251,6 +251,7 @@ class FluxTorqueReference:
     def __init__(self, ref):
         self.psi_s_min, self.psi_s_max = ref.psi_s_min, ref.psi_s_max
         self.k_u = ref.k_u
+        self._k_u_inv_sqrt3 = self.k_u*_INV_SQRT3
         # Merged MTPV and current limits
         self.tau_M_lim = ref.tau_M_lim
         # MTPA locus
@@ -282,7 +283,7 @@ class FluxTorqueReference:
         psi_s_mtpa = np.clip(psi_s_mtpa, self.psi_s_min, self.psi_s_max)
 
         # Field weakening
-        u_s_max = self.k_u*u_dc/np.sqrt(3)
+        u_s_max = self._k_u_inv_sqrt3*u_dc
         psi_s_max = u_s_max/np.abs(w_m) if np.abs(w_m) > 0 else np.inf
 
         # Flux reference
@@ -3,11 +3,11 @@
 """
 
 from dataclasses import dataclass, InitVar
+import math
 import numpy as np
-from motulator._helpers import abc2complex
+from motulator._helpers import abc2complex_scalar, _INV_SQRT3
 from motulator.control._common import Ctrl, ComplexPICtrl, PWM, SpeedCtrl
 from motulator.control.sm._torque import TorqueCharacteristics
-from motulator._utils import Bunch
 
 
 # %%
@@ -82,6 +82,7 @@ class VectorCtrl(Ctrl):
         self.T_s = T_s
         self.sensorless = sensorless
         self.n_p = par.n_p
+        self._inv_n_p = 1/par.n_p
         self.current_ref = CurrentReference(par, ref)
         self.current_ctrl = CurrentCtrl(par, 2*np.pi*200)
         if sensorless:
@@ -91,6 +92,44 @@ class VectorCtrl(Ctrl):
         self.speed_ctrl = SpeedCtrl(par.J, 2*np.pi*4)
         self.pwm = PWM()
         self.w_m_ref = callable
+        # Precomputed speed reference, see precompute_reference()
+        self._w_m_ref_table = None
+
+    def precompute_reference(self, T_end):
+        """
+        Evaluate the speed reference in advance.
+
+        The speed reference is evaluated at once for the sampling instants up 
+        to `T_end`, after which the control loop reads it from a table instead 
+        of calling `w_m_ref` in every sampling period. The table is looked up 
+        by the clock time, and the callable is used for the instants not in 
+        the table. The speed reference has to be set before calling this 
+        method and it has to accept an array of time instants. If `w_m_ref` 
+        is reassigned afterwards, the table is discarded.
+
+        Parameters
+        ----------
+        T_end : float
+            End time of the table (s).
+
+        """
+        n_steps = int(np.ceil((T_end - self.clock.t)/self.T_s)) + 1
+        t = self.clock.sampling_instants(self.T_s, n_steps)
+        w_m_ref = np.broadcast_to(self.w_m_ref(t), t.shape)
+        self._w_m_ref_table = (self.w_m_ref, t.tolist(), w_m_ref.tolist())
+
+    def _speed_reference(self, t):
+        """Get the speed reference, from the precomputed table if possible."""
+        if self._w_m_ref_table is not None:
+            w_m_ref_fun, t_table, w_m_ref_table = self._w_m_ref_table
+            if w_m_ref_fun is self.w_m_ref:
+                k = round((t - t_table[0])/self.T_s)
+                if 0 <= k < len(t_table) and t_table[k] == t:
+                    return w_m_ref_table[k]
+            else:
+                # The speed reference has been reassigned
+                self._w_m_ref_table = None
+        return self.w_m_ref(t)
 
     # pylint: disable=too-many-locals
     def __call__(self, mdl):
@@ -111,7 +150,7 @@ class VectorCtrl(Ctrl):
 
         """
         # Get the speed reference
-        w_m_ref = self.w_m_ref(self.clock.t)
+        w_m_ref = self._speed_reference(self.clock.t)
 
         # Measure the feedback signals
         i_s_abc = mdl.machine.meas_currents()
@@ -124,28 +163,35 @@ class VectorCtrl(Ctrl):
         else:
             w_m = self.n_p*mdl.mechanics.meas_speed()
             theta_m = self.n_p*mdl.mechanics.meas_position()
-            theta_m = np.mod(theta_m + np.pi, 2*np.pi) - np.pi
+            theta_m = math.remainder(theta_m, 2*math.pi)  # Limit to [-pi, pi]
 
-        # Current vector in estimated rotor coordinates
-        i_s = np.exp(-1j*theta_m)*abc2complex(i_s_abc)
+        # Current vector in estimated rotor coordinates. The transformations
+        # are written out using scalar math in order to avoid the NumPy
+        # overhead in the sampling loop.
+        i_ss = abc2complex_scalar(*i_s_abc.tolist())
+        cos_theta, sin_theta = math.cos(theta_m), math.sin(theta_m)
+        i_s = complex(
+            cos_theta*i_ss.real + sin_theta*i_ss.imag,
+            cos_theta*i_ss.imag - sin_theta*i_ss.real)
 
         # Outputs
-        tau_M_ref = self.speed_ctrl.output(w_m_ref/self.n_p, w_m/self.n_p)
+        tau_M_ref = self.speed_ctrl.output(
+            w_m_ref*self._inv_n_p, w_m*self._inv_n_p)
         i_s_ref, tau_M_ref_lim = self.current_ref.output(tau_M_ref, w_m, u_dc)
         u_s_ref = self.current_ctrl.output(i_s_ref, i_s)
 
         # Data logging
-        data = Bunch(
-            i_s=i_s,
-            i_s_ref=i_s_ref,
-            t=self.clock.t,
-            tau_M_ref_lim=tau_M_ref_lim,
-            theta_m=theta_m,
-            u_dc=u_dc,
-            u_s=u_s,
-            w_m=w_m,
-            w_m_ref=w_m_ref,
-        )
+        data = {
+            "i_s": i_s,
+            "i_s_ref": i_s_ref,
+            "t": self.clock.t,
+            "tau_M_ref_lim": tau_M_ref_lim,
+            "theta_m": theta_m,
+            "u_dc": u_dc,
+            "u_s": u_s,
+            "w_m": w_m,
+            "w_m_ref": w_m_ref,
+        }
         self.save(data)
 
         # Update states
@@ -256,10 +302,38 @@ class CurrentReferencePars:
         mtpa = tq.mtpa_locus(self.i_s_max, self.psi_s_min)
         lim = tq.mtpv_and_current_limits(self.i_s_max)
         # MTPA locus
-        self.i_sd_mtpa = mtpa.i_sd_vs_tau_M
+        self.i_sd_mtpa = _np_interp_lut(mtpa.i_sd_vs_tau_M)
         # Merged MTPV and current limits
-        self.tau_M_lim = lim.tau_M_vs_abs_psi_s
-        self.i_sd_lim = lim.i_sd_vs_tau_M
+        self.tau_M_lim = _np_interp_lut(lim.tau_M_vs_abs_psi_s)
+        self.i_sd_lim = _np_interp_lut(lim.i_sd_vs_tau_M)
+
+
+def _np_interp_lut(lut):
+    """
+    Convert a linear interp1d look-up table to a callable using np.interp.
+
+    The look-up tables are evaluated in every sampling period, where the
+    per-call overhead of the interp1d objects is significant. The data points
+    of the table are kept as such. Outside the data range, the output is
+    clamped to the fill values (or to the end values if `lut` extrapolates).
+
+    Parameters
+    ----------
+    lut : interp1d
+        Linear look-up table.
+
+    Returns
+    -------
+    callable
+        Look-up table.
+
+    """
+    x, y = lut.x, lut.y
+    if isinstance(lut.fill_value, str):
+        left, right = y[0], y[-1]
+    else:
+        left, right = np.broadcast_to(lut.fill_value, 2)
+    return lambda u: np.interp(u, x, y, left, right)
 
 
 # %%
@@ -306,6 +380,7 @@ class CurrentReference:
     def __init__(self, par, ref):
         # Machine model parameters
         self.n_p = par.n_p
+        self._n_p_15 = 1.5*par.n_p
         self.L_d, self.L_q, self.psi_f = par.L_d, par.L_q, par.psi_f
         # Reference generation parameters
         self.i_sd_mtpa = ref.i_sd_mtpa  # MTPA locus
@@ -313,8 +388,11 @@ class CurrentReference:
         self.i_sd_lim = ref.i_sd_lim  # Merged MTPV and current limits
         self.psi_s_min = ref.psi_s_min  # Minimum flux linkage
         self.i_s_max = ref.i_s_max  # Maximum current
+        self._i_s_max_sq = ref.i_s_max**2
         self.k_fw = ref.k_fw  # Field-weakening gain
         self.k_u = ref.k_u  # Voltage utilization factor
+        self._k_u_inv_sqrt3 = self.k_u*_INV_SQRT3
+        self._tau_M_max_inf = float(self.tau_M_lim(np.inf))
         # State
         self.i_sd_ref = 0
 
@@ -341,38 +419,36 @@ class CurrentReference:
         """
 
         def limit_torque(tau_M_ref, w_m, u_dc):
-            if np.abs(w_m) > 0:
-                psi_s_max = self.k_u*u_dc/np.sqrt(3)/np.abs(w_m)
+            if w_m != 0.:
+                psi_s_max = self._k_u_inv_sqrt3*u_dc/abs(w_m)
                 tau_M_max = self.tau_M_lim(psi_s_max)
             else:
-                tau_M_max = self.tau_M_lim(np.inf)
+                tau_M_max = self._tau_M_max_inf
 
-            if np.abs(tau_M_ref) > tau_M_max:
-                tau_M_ref = np.sign(tau_M_ref)*tau_M_max
-
-            return tau_M_ref
+            return math.copysign(min(abs(tau_M_ref), tau_M_max), tau_M_ref)
 
         # Limit the torque reference according to MTPV and current limits
         tau_M_ref = limit_torque(tau_M_ref, w_m, u_dc)
 
         # q-axis current reference
         psi_t = self.psi_f + (self.L_d - self.L_q)*self.i_sd_ref
-        i_sq_ref = tau_M_ref/(1.5*self.n_p*psi_t) if psi_t != 0 else 0
+        k_tau = self._n_p_15*psi_t  # Torque per q-axis current
+        i_sq_ref = tau_M_ref/k_tau if k_tau != 0 else 0
 
         # Limit the q-axis current reference
-        i_sd_mtpa = self.i_sd_mtpa(np.abs(tau_M_ref))
-        i_sq_max = np.min([
-            np.sqrt(self.i_s_max**2 - self.i_sd_ref**2),
-            np.sqrt(self.i_s_max**2 - i_sd_mtpa**2)
-        ])
-        if np.abs(i_sq_ref) > i_sq_max:
-            i_sq_ref = np.sign(i_sq_ref)*i_sq_max
+        i_sd_mtpa = self.i_sd_mtpa(abs(tau_M_ref))
+        i_sq_max_sq = self._i_s_max_sq - max(self.i_sd_ref**2, i_sd_mtpa**2)
+        if i_sq_max_sq < 0:
+            # Same error as from NumPy, handled in the simulation loop
+            raise FloatingPointError("invalid value encountered in sqrt")
+        i_sq_max = math.sqrt(i_sq_max_sq)
+        i_sq_ref = math.copysign(min(abs(i_sq_ref), i_sq_max), i_sq_ref)
 
         # Current reference
         i_s_ref = self.i_sd_ref + 1j*i_sq_ref
 
         # Limited torque (for the speed controller)
-        tau_M_ref_lim = 1.5*self.n_p*psi_t*i_sq_ref
+        tau_M_ref_lim = k_tau*i_sq_ref
 
         return i_s_ref, tau_M_ref_lim
 
@@ -392,13 +468,13 @@ class CurrentReference:
             DC-bus voltage (V).
 
         """
-        u_s_max = self.k_u*u_dc/np.sqrt(3)
-        self.i_sd_ref += T_s*self.k_fw*(u_s_max - np.abs(u_s_ref))
+        u_s_max = self._k_u_inv_sqrt3*u_dc
+        self.i_sd_ref += T_s*self.k_fw*(u_s_max - abs(u_s_ref))
 
         # Limit the current
-        i_sd_mtpa = self.i_sd_mtpa(np.abs(tau_M_ref_lim))
-        i_sd_lim = self.i_sd_lim(np.abs(tau_M_ref_lim))
-        self.i_sd_ref = np.clip(self.i_sd_ref, i_sd_lim, i_sd_mtpa)
+        i_sd_mtpa = self.i_sd_mtpa(abs(tau_M_ref_lim))
+        i_sd_lim = self.i_sd_lim(abs(tau_M_ref_lim))
+        self.i_sd_ref = min(max(self.i_sd_ref, i_sd_lim), i_sd_mtpa)
 
 
 # %%
@@ -448,24 +524,36 @@ class Observer:
     """
 
     # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        "R_s", "L_d", "L_q", "psi_f", "alpha_o", "sensorless", "k1", "k2",
+        "theta_m", "w_m", "psi_s", "_sigma0", "_k1_slope", "_k1_default",
+        "_update")
+
     def __init__(self, par, alpha_o=2*np.pi*40, k=None, sensorless=True):
         self.R_s = par.R_s
         self.L_d, self.L_q, self.psi_f = par.L_d, par.L_q, par.psi_f
-        self.psi_f = par.psi_f
         self.alpha_o = alpha_o
         self.sensorless = sensorless
         self.k1 = k
+        # The default sensorless gain is inlined in the update method
+        self._k1_default = sensorless and k is None
         if self.sensorless:
             if self.k1 is None:  # If not given, use the default gains
                 sigma0 = .25*par.R_s*(par.L_d + par.L_q)/(par.L_d*par.L_q)
-                self.k1 = lambda w_m: (sigma0 + .2*np.abs(w_m))
+                self._sigma0, self._k1_slope = sigma0, .2
+                self.k1 = lambda w_m: self._sigma0 + self._k1_slope*abs(w_m)
             self.k2 = self.k1
         else:
             if self.k1 is None:
                 self.k1 = lambda w_m: 2*np.pi*15
-            self.k2 = 0*self.k1
-        # Initial states
-        self.theta_m, self.w_m, self.psi_s = 0, 0, par.psi_f
+            self.k2 = lambda w_m: 0.
+        # Initial states as native Python scalars
+        self.theta_m, self.w_m, self.psi_s = 0., 0., complex(par.psi_f)
+        # The mode is fixed, so select the update method only once
+        if sensorless:
+            self._update = self._update_sensorless
+        else:
+            self._update = self._update_sensored
 
     def update(self, T_s, u_s, i_s, w_m=None):
         """
@@ -484,28 +572,80 @@ class Observer:
             mode. The default is None. 
 
         """
+        self._update(T_s, u_s, i_s, w_m)
+
+    def _update_sensorless(self, T_s, u_s, i_s, w_m=None):
+        """
+        Update the states for the next sampling period.
+
+        Parameters
+        ----------
+        T_s : float
+            Sampling period (s).
+        u_s : complex
+            Stator voltage (V) in estimated rotor coordinates.
+        i_s : complex
+            Stator current (A) in estimated rotor coordinates.
+        w_m : float, optional
+            Not used in the sensorless mode. The default is None. 
+
+        """
+        # pylint: disable=unused-argument, too-many-locals
+        # Parameters and states as local variables
+        L_d, L_q, psi_f, alpha_o = self.L_d, self.L_q, self.psi_f, self.alpha_o
+        psi_s = self.psi_s
+
         # Estimation error
-        e = self.L_d*i_s.real + 1j*self.L_q*i_s.imag + self.psi_f - self.psi_s
+        e = L_d*i_s.real + 1j*L_q*i_s.imag + psi_f - psi_s
 
-        if self.sensorless:
-            # Auxiliary flux
-            psi_a = self.psi_f + (self.L_d - self.L_q)*np.conj(i_s)
+        # Auxiliary flux
+        psi_a = psi_f + (L_d - L_q)*i_s.conjugate()
+        abs_psi_a_sq = psi_a.real*psi_a.real + psi_a.imag*psi_a.imag
 
-            # Observer gains
+        # Observer gains
+        if self._k1_default:
+            k1 = self._sigma0 + self._k1_slope*abs(self.w_m)
+        else:
             k1 = self.k1(self.w_m)
-            k2 = k1*psi_a/np.conj(psi_a) if np.abs(psi_a) > 0 else k1
 
-            # Speed estimation
-            eps = -np.imag(e/psi_a) if np.abs(psi_a) > 0 else 0
-            w_s = 2*self.alpha_o*eps + self.w_m
+        if abs_psi_a_sq > 0:
+            k2 = k1*psi_a*psi_a/abs_psi_a_sq
+            # Speed estimation error, -Im(e/psi_a)
+            eps = -(e*psi_a.conjugate()).imag/abs_psi_a_sq
         else:
-            k1, k2 = self.k1, 0
-            w_s = w_m
-            eps = 0
+            k2, eps = k1, 0
+        w_s = 2*alpha_o*eps + self.w_m
+
+        # Update the states
+        self.psi_s = psi_s + T_s*(
+            u_s - self.R_s*i_s - 1j*w_s*psi_s + k1*e + k2*e.conjugate())
+        self.w_m += T_s*alpha_o*alpha_o*eps
+        # Limit into [-pi, pi]
+        self.theta_m = math.remainder(self.theta_m + T_s*w_s, 2*math.pi)
+
+    def _update_sensored(self, T_s, u_s, i_s, w_m):
+        """
+        Update the states for the next sampling period.
+
+        Parameters
+        ----------
+        T_s : float
+            Sampling period (s).
+        u_s : complex
+            Stator voltage (V) in estimated rotor coordinates.
+        i_s : complex
+            Stator current (A) in estimated rotor coordinates.
+        w_m : float
+            Rotor angular speed (electrical rad/s).
+
+        """
+        psi_s = self.psi_s
+
+        # Estimation error
+        e = self.L_d*i_s.real + 1j*self.L_q*i_s.imag + self.psi_f - psi_s
 
         # Update the states
-        self.psi_s += T_s*(
-            u_s - self.R_s*i_s - 1j*w_s*self.psi_s + k1*e + k2*np.conj(e))
-        self.w_m += T_s*self.alpha_o**2*eps
-        self.theta_m += T_s*w_s  # Next line: limit into [-pi, pi)
-        self.theta_m = np.mod(self.theta_m + np.pi, 2*np.pi) - np.pi
+        self.psi_s = psi_s + T_s*(
+            u_s - self.R_s*i_s - 1j*w_m*psi_s + self.k1(w_m)*e)
+        # Limit into [-pi, pi]
+        self.theta_m = math.remainder(self.theta_m + T_s*w_m, 2*math.pi)
@@ -74,7 +74,8 @@ class Inverter:
             DC-side current (A).
 
         """
-        i_dc = 1.5*np.real(q*np.conj(i_ac))
+        # Re{q*conj(i_ac)} using real arithmetic
+        i_dc = 1.5*(q.real*i_ac.real + q.imag*i_ac.imag)
         return i_dc
 
     def meas_dc_voltage(self):
@@ -173,7 +174,7 @@ class FrequencyConverter(Inverter):
 
         Returns
         -------
-        list, length 2
+        tuple, length 2
             Time derivative of the state vector, [du_dc, di_L]
 
         """
@@ -187,4 +188,4 @@ class FrequencyConverter(Inverter):
         # The inductor current cannot be negative due to the diode bridge
         if i_L < 0 and di_L < 0:
             di_L = 0
-        return [du_dc, di_L]
+        return du_dc, di_L
@@ -54,7 +54,7 @@ class Mechanics:
 
         Returns
         -------
-        list, length 2
+        tuple, length 2
             Time derivatives of the state vector.
 
         """
@@ -63,7 +63,7 @@ class Mechanics:
         # Time derivatives
         dw_M = (tau_M - tau_L)/self.J
         dtheta_M = w_M
-        return [dw_M, dtheta_M]
+        return dw_M, dtheta_M
 
     def meas_speed(self):
         """
@@ -163,7 +163,7 @@ class MechanicsTwoMass(Mechanics):
 
         Returns
         -------
-        list, length 4
+        tuple, length 4
             Time derivatives of the state vector.
 
         """
@@ -177,7 +177,7 @@ class MechanicsTwoMass(Mechanics):
         dw_L = (tau_S - tau_L)/self.J_L
         dtheta_ML = w_M - w_L
 
-        return [dw_M, dtheta_M, dw_L, dtheta_ML]
+        return dw_M, dtheta_M, dw_L, dtheta_ML
 
     def meas_load_speed(self):
         """
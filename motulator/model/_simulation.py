@@ -202,7 +202,7 @@ class Simulation:
     
     Methods
     -------
-    simulate(t_stop=1, max_step=np.inf)
+    simulate(t_stop=1, max_step=np.inf, method="RK45", full_first_step=False)
         Solve the continuous-time model and call the discrete-time controller.
     save_mat(name="sim")
         Save the simulation results into a .mat file.
@@ -218,7 +218,12 @@ class Simulation:
         else:
             self._pwm = _zoh
 
-    def simulate(self, t_stop=1, max_step=np.inf):
+    def simulate(
+            self,
+            t_stop=1,
+            max_step=np.inf,
+            method="RK45",
+            full_first_step=False):
         """
         Solve the continuous-time model and call the discrete-time controller.
 
@@ -228,15 +233,29 @@ class Simulation:
             Simulation stop time. The default is 1.
         max_step : float, optional
             Max step size of the solver. The default is inf.
+        method : str, optional
+            Integration method of `solve_ivp`, supporting complex-valued 
+            states, e.g., "RK45", "RK23", "DOP853", or "BDF". The default is 
+            "RK45".
+        full_first_step : bool, optional
+            If True, the solver first tries to integrate each switching 
+            interval in a single step (limited by `max_step`), skipping the 
+            automatic selection of the initial step size. The error control of 
+            the solver is kept, but fewer intermediate points are stored. This 
+            reduces the solver overhead, since the switching intervals are 
+            typically short compared to the time constants of the system. The 
+            default is False.
 
         Notes
         -----
         Other options of `solve_ivp` could be easily changed if needed, but, for
-        simplicity, only `max_step` is included as an option of this method.
+        simplicity, only `max_step`, `method`, and `full_first_step` are 
+        included as options of this method.
 
         """
+        opts = {"max_step": max_step, "method": method}
         try:
-            self._simulation_loop(t_stop, max_step)
+            self._simulation_loop(t_stop, opts, full_first_step)
         except FloatingPointError:
             print(f"Invalid value encountered at {self.mdl.t0:.2f} seconds.")
         # Call the post-processing functions
@@ -244,8 +263,9 @@ class Simulation:
         self.ctrl.post_process()
 
     @np.errstate(invalid="raise")
-    def _simulation_loop(self, t_stop, max_step):
+    def _simulation_loop(self, t_stop, opts, full_first_step):
         """Run the main simulation loop."""
+        # pylint: disable=too-many-locals
         while self.mdl.t0 <= t_stop:
 
             # Run the digital controller
@@ -269,7 +289,10 @@ class Simulation:
 
                     # Integrate over t_span
                     t_span = (self.mdl.t0, self.mdl.t0 + t_step)
-                    sol = solve_ivp(self.mdl.f, t_span, x0, max_step=max_step)
+                    if full_first_step:
+                        opts["first_step"] = min(
+                            t_span[1] - t_span[0], opts["max_step"])
+                    sol = solve_ivp(self.mdl.f, t_span, x0, **opts)
 
                     # Set the new initial values (last points of the solution)
                     t0_new, x0_new = t_span[-1], sol.y[:, -1]
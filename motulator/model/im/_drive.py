@@ -5,8 +5,9 @@ Peak-valued complex space vectors are used. The space vector models are
 implemented in stator coordinates. 
 
 """
+import math
 import numpy as np
-from motulator._helpers import abc2complex, complex2abc
+from motulator._helpers import abc2complex, complex2abc, _wrap_pi
 from motulator._utils import Bunch
 
 
@@ -17,7 +18,9 @@ class InductionMachine:
 
     An induction machine is modeled using the Γ-equivalent model [#Sle1989]_. 
     The model is implemented in stator coordinates. The flux linkages are used 
-    as state variables.
+    as state variables. The parameters should not be changed after the 
+    initialization, since the coefficients of the state equations are 
+    precomputed from them. Create a new instance to change the parameters.
 
     Parameters
     ----------
@@ -57,11 +60,20 @@ class InductionMachine:
 
     """
 
+    # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        "n_p", "R_s", "R_r", "L_ell", "L_s", "psi_ss0", "psi_rs0",
+        "_inv_L_ell", "_inv_L_s", "_jn_p")
+
     def __init__(self, n_p, R_s, R_r, L_ell, L_s):
         # pylint: disable=too-many-arguments
         self.n_p = n_p
         self.R_s, self.R_r = R_s, R_r
         self.L_ell, self.L_s = L_ell, L_s
+        # Constant coefficients of the state equations
+        self._inv_L_ell = 1/L_ell
+        self._inv_L_s = None if callable(L_s) else 1/L_s
+        self._jn_p = 1j*n_p
         # Initial values
         self.psi_ss0, self.psi_rs0 = 0j, 0j
 
@@ -84,8 +96,8 @@ class InductionMachine:
             Rotor current (A).
 
         """
-        i_rs = (psi_rs - psi_ss)/self.L_ell
-        i_ss = psi_ss/self.L_s - i_rs
+        i_rs = (psi_rs - psi_ss)*self._inv_L_ell
+        i_ss = psi_ss*self._inv_L_s - i_rs
 
         return i_ss, i_rs
 
@@ -111,7 +123,8 @@ class InductionMachine:
 
         """
         i_ss, i_rs = self.currents(psi_ss, psi_rs)
-        tau_M = 1.5*self.n_p*np.imag(i_ss*np.conj(psi_ss))
+        # Im{i_ss*conj(psi_ss)} using real arithmetic
+        tau_M = 1.5*self.n_p*(i_ss.imag*psi_ss.real - i_ss.real*psi_ss.imag)
 
         return i_ss, i_rs, tau_M
 
@@ -132,7 +145,7 @@ class InductionMachine:
 
         Returns
         -------
-        complex list, length 2
+        complex tuple, length 2
             Time derivative of the state vector, [dpsi_ss, dpsi_rs]
         i_ss : complex
             Stator current (A).
@@ -147,11 +160,14 @@ class InductionMachine:
         computation in simulation.
 
         """
-        i_ss, i_rs, tau_M = self.magnetic(psi_ss, psi_rs)
+        # The magnetic model is inlined here, since this method is called
+        # by the solver at every evaluation of the state derivatives
+        i_ss, i_rs = self.currents(psi_ss, psi_rs)
+        tau_M = 1.5*self.n_p*(i_ss.imag*psi_ss.real - i_ss.real*psi_ss.imag)
         dpsi_ss = u_ss - self.R_s*i_ss
-        dpsi_rs = -self.R_r*i_rs + 1j*self.n_p*w_M*psi_rs
+        dpsi_rs = -self.R_r*i_rs + self._jn_p*w_M*psi_rs
 
-        return [dpsi_ss, dpsi_rs], i_ss, tau_M
+        return (dpsi_ss, dpsi_rs), i_ss, tau_M
 
     def meas_currents(self):
         """
@@ -180,6 +196,9 @@ class InductionMachineSaturated(InductionMachine):
 
         L_s = L_s(abs(psi_ss))
 
+    As in the base class, the parameters should not be changed after the
+    initialization. The last evaluated value of `L_s` is cached as well.
+
     Parameters
     ----------
     n_p : int
@@ -195,14 +214,31 @@ class InductionMachineSaturated(InductionMachine):
 
     """
 
+    __slots__ = ("_abs_psi_ss", "_L_s")
+
+    def __init__(self, n_p, R_s, R_r, L_ell, L_s):
+        # pylint: disable=too-many-arguments
+        super().__init__(n_p, R_s, R_r, L_ell, L_s)
+        # Last evaluated flux magnitude and stator inductance
+        self._abs_psi_ss, self._L_s = None, None
+
     def currents(self, psi_ss, psi_rs):
         """Override the base class method.
         
         """
-        # Saturated value of the stator inductance.
-        L_s = self.L_s(np.abs(psi_ss))
+        # Saturated value of the stator inductance
+        if isinstance(psi_ss, complex):
+            # The solver often evaluates the same state repeatedly (e.g. at
+            # the segment boundaries), so reuse the last inductance value
+            abs_psi_ss = abs(psi_ss)
+            if abs_psi_ss != self._abs_psi_ss:
+                self._abs_psi_ss = abs_psi_ss
+                self._L_s = self.L_s(abs_psi_ss)
+            L_s = self._L_s
+        else:
+            L_s = self.L_s(np.abs(psi_ss))
         # Currents
-        i_rs = (psi_rs - psi_ss)/self.L_ell
+        i_rs = (psi_rs - psi_ss)*self._inv_L_ell
         i_ss = psi_ss/L_s - i_rs
         return i_ss, i_rs
 
@@ -231,6 +267,8 @@ class InductionMachineInvGamma(InductionMachine):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, n_p, R_s, R_R, L_sgm, L_M):
         # pylint: disable=too-many-arguments
         # Convert the inverse-Γ parameters to the Γ parameters
@@ -274,12 +312,14 @@ class Drive:
 
     """
 
+    __slots__ = ("machine", "mechanics", "converter", "t0", "data")
+
     def __init__(self, machine=None, mechanics=None, converter=None):
         self.machine = machine
         self.mechanics = mechanics
         self.converter = converter
         self.t0 = 0  # Initial time
-        # Store the solution in these lists
+        # Store the solution segments in these lists
         self.data = Bunch()  # Stores the solution data
         self.data.t, self.data.q = [], []
         self.data.psi_ss, self.data.psi_rs = [], []
@@ -320,8 +360,8 @@ class Drive:
         self.machine.psi_rs0 = x0[1]
         # x0[2].imag and x0[3].imag are always zero
         self.mechanics.w_M0 = x0[2].real
-        # Limit theta_M0 = x0[3].real into [-pi, pi)
-        self.mechanics.theta_M0 = np.mod(x0[3].real + np.pi, 2*np.pi) - np.pi
+        # Limit theta_M0 = x0[3].real into [-pi, pi]
+        self.mechanics.theta_M0 = math.remainder(x0[3].real, 2*math.pi)
 
     def f(self, t, x):
         """
@@ -336,19 +376,24 @@ class Drive:
 
         Returns
         -------
-        complex list
+        complex tuple
             State derivatives.
 
         """
-        # Unpack the states
-        psi_ss, psi_rs, w_M, _ = x
+        # Unpack the states as Python scalars, which are faster to operate on
+        # than NumPy scalars
+        psi_ss, psi_rs, w_M, _ = x.tolist()
+        # The mechanical states are real, and the load torque models may
+        # compare them, which is not supported for Python complex numbers
+        w_M = w_M.real
         # Interconnections: outputs for computing the state derivatives
         u_ss = self.converter.ac_voltage(
             self.converter.q, self.converter.u_dc0)
         # State derivatives plus the outputs for interconnections
         machine_f, _, tau_M = self.machine.f(psi_ss, psi_rs, u_ss, w_M)
         mechanics_f = self.mechanics.f(t, w_M, tau_M)
-        # List of state derivatives
+        # Tuple of state derivatives. A new object is returned on each call,
+        # since the solver keeps references to the earlier evaluations.
         return machine_f + mechanics_f
 
     def save(self, sol):
@@ -361,28 +406,29 @@ class Drive:
             Solution from the solver.
 
         """
-        self.data.t.extend(sol.t)
-        self.data.q.extend(sol.q)
-        self.data.psi_ss.extend(sol.y[0])
-        self.data.psi_rs.extend(sol.y[1])
-        self.data.w_M.extend(sol.y[2].real)
-        self.data.theta_M.extend(sol.y[3].real)
+        self.data.t.append(sol.t)
+        self.data.q.append(sol.q)
+        self.data.psi_ss.append(sol.y[0])
+        self.data.psi_rs.append(sol.y[1])
+        self.data.w_M.append(sol.y[2].real)
+        self.data.theta_M.append(sol.y[3].real)
 
     def post_process(self):
         """Transform the lists to the ndarray format and post-process them.
         
         """
-        # From lists to the ndarray
-        for key in self.data:
-            self.data[key] = np.asarray(self.data[key])
+        # Concatenate the solution segments into arrays
+        for key, value in self.data.items():
+            self.data[key] = np.concatenate(value) if value else np.asarray(
+                value)
 
         # Some useful variables
         self.data.i_ss, _, self.data.tau_M = self.machine.magnetic(
             self.data.psi_ss, self.data.psi_rs)
-        self.data.theta_M = np.mod(  # Limit into [-pi, pi)
-            self.data.theta_M + np.pi, 2*np.pi) - np.pi
-        self.data.theta_m = np.mod(  # Limit into [-pi, pi)
-            self.machine.n_p*self.data.theta_M + np.pi, 2*np.pi) - np.pi
+        # Limit the angles into [-pi, pi) in place
+        _wrap_pi(self.data.theta_M, out=self.data.theta_M)
+        self.data.theta_m = self.machine.n_p*self.data.theta_M
+        _wrap_pi(self.data.theta_m, out=self.data.theta_m)
         self.data.w_m = self.machine.n_p*self.data.w_M
         self.data.tau_L = (
             self.mechanics.tau_L_t(self.data.t) +
@@ -391,10 +437,10 @@ class Drive:
             self.data.q, self.converter.u_dc0)
 
         # Compute the inverse-Γ rotor flux
-        try:
-            # Saturable stator inductance
+        if callable(self.machine.L_s):
+            # Saturable stator inductance, evaluated over the whole array
             L_s = self.machine.L_s(np.abs(self.data.psi_ss))
-        except TypeError:
+        else:
             # Constant stator inductance
             L_s = self.machine.L_s
         gamma = L_s/(L_s + self.machine.L_ell)  # Magnetic coupling factor
@@ -421,9 +467,10 @@ class DriveWithDiodeBridge(Drive):
                 
     """
 
+    __slots__ = ()
+
     def __init__(self, machine=None, mechanics=None, converter=None):
         super().__init__(machine, mechanics, converter)
-        self.converter = converter
         self.data.u_dc, self.data.i_L = [], []
 
     def get_initial_values(self):
@@ -447,45 +494,58 @@ class DriveWithDiodeBridge(Drive):
         """Override the base class.
         
         """
-        # Unpack the states for better readability
-        psi_ss, psi_rs, w_M, _, u_dc, i_L = x
+        # Unpack the states as Python scalars
+        psi_ss, psi_rs, w_M, _, u_dc, i_L = x.tolist()
+        # The mechanical and DC-bus states are real, and they may be compared
+        # in the load torque and converter models
+        w_M, u_dc, i_L = w_M.real, u_dc.real, i_L.real
 
         # Interconnections: outputs for computing the state derivatives
-        u_ss = self.converter.ac_voltage(self.converter.q, u_dc)
+        converter = self.converter
+        q = converter.q
+        u_ss = converter.ac_voltage(q, u_dc)
         mach_f, i_ss, tau_M = self.machine.f(psi_ss, psi_rs, u_ss, w_M)
-        i_dc = self.converter.dc_current(self.converter.q, i_ss)
+        i_dc = converter.dc_current(q, i_ss)
 
         # Return the list of state derivatives
         return (
             mach_f + self.mechanics.f(t, w_M, tau_M) +
-            self.converter.f(t, u_dc, i_L, i_dc))
+            converter.f(t, u_dc, i_L, i_dc))
 
     def save(self, sol):
         """Extend the base class.
         
         """
         super().save(sol)
-        self.data.u_dc.extend(sol.y[4].real)
-        self.data.i_L.extend(sol.y[5].real)
+        self.data.u_dc.append(sol.y[4].real)
+        self.data.i_L.append(sol.y[5].real)
 
     def post_process(self):
         """Extend the base class.
         
         """
         super().post_process()
-        # From lists to the ndarray
-        self.data.u_dc = np.asarray(self.data.u_dc)
-        self.data.i_L = np.asarray(self.data.i_L)
         # Some useful variables
         self.data.u_ss = self.converter.ac_voltage(self.data.q, self.data.u_dc)
         self.data.i_dc = self.converter.dc_current(self.data.q, self.data.i_ss)
         u_g_abc = self.converter.grid_voltages(self.data.t)
         self.data.u_g = abc2complex(u_g_abc)
+        # Highest and lowest phase voltages
+        u_max, u_min = u_g_abc.max(axis=0), u_g_abc.min(axis=0)
         # Voltage at the output of the diode bridge
-        self.data.u_di = np.amax(u_g_abc, axis=0) - np.amin(u_g_abc, axis=0)
-        # Diode briddge switching states (-1, 0, 1)
-        q_g_abc = ((np.amax(u_g_abc, axis=0) == u_g_abc).astype(int) -
-                   (np.amin(u_g_abc, axis=0) == u_g_abc).astype(int))
+        self.data.u_di = u_max - u_min
+        # Phases with the highest and lowest voltages. Comparing whole rows is
+        # much faster than argmax/argmin over the short axis. On ties, only
+        # the first phase is kept, as argmax/argmin would do.
+        is_max, is_min = u_g_abc == u_max, u_g_abc == u_min
+        for k in (1, 2):
+            is_max[k] &= ~is_max[:k].any(axis=0)
+            is_min[k] &= ~is_min[:k].any(axis=0)
+        # No diode conducts if all the phase voltages are equal
+        is_max &= u_max != u_min
+        is_min &= u_max != u_min
+        # Diode bridge switching states (-1, 0, 1)
+        q_g_abc = is_max.astype(int) - is_min
         # Grid current space vector
         self.data.i_g = abc2complex(q_g_abc)*self.data.i_L
 
@@ -509,6 +569,8 @@ class DriveTwoMassMechanics(Drive):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, machine=None, mechanics=None, converter=None):
         super().__init__(machine, mechanics, converter)
         self.data.w_L, self.data.theta_ML = [], []
@@ -526,21 +588,23 @@ class DriveTwoMassMechanics(Drive):
         """Extend the base class."""
         super().set_initial_values(t0, x0[0:4])
         self.mechanics.w_L0 = x0[4].real
-        self.mechanics.theta_ML0 = np.mod(x0[5].real + np.pi, 2*np.pi) - np.pi
+        self.mechanics.theta_ML0 = math.remainder(x0[5].real, 2*math.pi)
 
     def f(self, t, x):
         """Override the base class.
         
         """
-        # Unpack the states
-        psi_ss, psi_rs, w_M, _, w_L, theta_ML = x
+        # Unpack the states as Python scalars
+        psi_ss, psi_rs, w_M, _, w_L, theta_ML = x.tolist()
+        # The mechanical states are real, see the base class
+        w_M, w_L, theta_ML = w_M.real, w_L.real, theta_ML.real
         # Interconnections: outputs for computing the state derivatives
         u_ss = self.converter.ac_voltage(
             self.converter.q, self.converter.u_dc0)
         # State derivatives plus the outputs for interconnections
         machine_f, _, tau_M = self.machine.f(psi_ss, psi_rs, u_ss, w_M)
         mechanics_f = self.mechanics.f(t, w_M, w_L, theta_ML, tau_M)
-        # List of state derivatives
+        # Tuple of state derivatives
         return machine_f + mechanics_f
 
     def save(self, sol):
@@ -548,14 +612,5 @@ class DriveTwoMassMechanics(Drive):
         
         """
         super().save(sol)
-        self.data.w_L.extend(sol.y[4].real)
-        self.data.theta_ML.extend(sol.y[5].real)
-
-    def post_process(self):
-        """Extend the base class.
-        
-        """
-        super().post_process()
-        # From lists to the ndarray
-        self.data.w_L = np.asarray(self.data.w_L)
-        self.data.theta_ML = np.asarray(self.data.theta_ML)
+        self.data.w_L.append(sol.y[4].real)
+        self.data.theta_ML.append(sol.y[5].real)
@@ -4,8 +4,9 @@ Continuous-time models for synchronous motor drives.
 Peak-valued complex space vectors are used.
 
 """
+import math
 import numpy as np
-from motulator._helpers import complex2abc
+from motulator._helpers import complex2abc, _wrap_pi
 from motulator._utils import Bunch
 
 
@@ -87,7 +88,8 @@ class SynchronousMachine:
 
         """
         i_s = self.current(psi_s)
-        tau_M = 1.5*self.n_p*np.imag(i_s*np.conj(psi_s))
+        # Im{i_s*conj(psi_s)} using real arithmetic
+        tau_M = 1.5*self.n_p*(i_s.imag*psi_s.real - i_s.real*psi_s.imag)
         return i_s, tau_M
 
     def f(self, psi_s, u_s, w_M):
@@ -105,7 +107,7 @@ class SynchronousMachine:
 
         Returns
         -------
-        complex list, length 2
+        complex tuple, length 2
             Time derivative of the state vector, [dpsi_s, dtheta_m0]
         i_s : complex
             Stator current (A).
@@ -123,7 +125,7 @@ class SynchronousMachine:
         i_s, tau_M = self.magnetic(psi_s)
         dpsi_s = u_s - self.R_s*i_s - 1j*self.n_p*w_M*psi_s
         dtheta_m = self.n_p*w_M
-        return [dpsi_s, dtheta_m], i_s, tau_M
+        return (dpsi_s, dtheta_m), i_s, tau_M
 
     def meas_currents(self):
         """
@@ -258,9 +260,9 @@ class Drive:
         # x0[1:3].imag are always zero
         self.machine.theta_m0 = x0[1].real
         self.mechanics.w_M0 = x0[2].real
-        # Limit the angles into [-pi, pi)
-        self.mechanics.theta_m0 = np.mod(x0[1].real + np.pi, 2*np.pi) - np.pi
-        self.mechanics.theta_M0 = np.mod(x0[3].real + np.pi, 2*np.pi) - np.pi
+        # Limit the angles into [-pi, pi]
+        self.mechanics.theta_m0 = math.remainder(x0[1].real, 2*math.pi)
+        self.mechanics.theta_M0 = math.remainder(x0[3].real, 2*math.pi)
 
     def f(self, t, x):
         """
@@ -275,7 +277,7 @@ class Drive:
 
         Returns
         -------
-        complex list
+        complex tuple
             State derivatives.
 
         """
@@ -291,7 +293,7 @@ class Drive:
         machine_f, _, tau_M = self.machine.f(psi_s, u_s, w_M)
         mechanics_f = self.mechanics.f(t, w_M, tau_M)
 
-        # List of state derivatives
+        # Tuple of state derivatives
         return machine_f + mechanics_f
 
     def save(self, sol):
@@ -325,11 +327,14 @@ class Drive:
             self.mechanics.tau_L_w(self.data.w_M))
         self.data.u_ss = self.converter.ac_voltage(
             self.data.q, self.converter.u_dc0)
-        self.data.theta_m = np.mod(  # Limit into [-pi, pi)
-            self.data.theta_m + np.pi, 2*np.pi) - np.pi
-        self.data.theta_M = np.mod(  # Limit into [-pi, pi)
-            self.data.theta_M + np.pi, 2*np.pi) - np.pi
-        self.data.i_ss = self.data.i_s*np.exp(1j*self.data.theta_m)
+        # Limit the angles into [-pi, pi) in place
+        _wrap_pi(self.data.theta_m, out=self.data.theta_m)
+        _wrap_pi(self.data.theta_M, out=self.data.theta_M)
+        # Rotate the current to stator coordinates without extra temporaries
+        i_ss = 1j*self.data.theta_m
+        np.exp(i_ss, out=i_ss)
+        i_ss *= self.data.i_s
+        self.data.i_ss = i_ss
 
 
 # %%
@@ -370,7 +375,7 @@ class DriveTwoMassMechanics(Drive):
         """
         super().set_initial_values(t0, x0[0:4])
         self.mechanics.w_L0 = x0[4].real
-        self.mechanics.theta_ML0 = np.mod(x0[5].real + np.pi, 2*np.pi) - np.pi
+        self.mechanics.theta_ML0 = math.remainder(x0[5].real, 2*math.pi)
 
     def f(self, t, x):
         """Override the base class.
@@ -385,7 +390,7 @@ class DriveTwoMassMechanics(Drive):
         # State derivatives plus the outputs for interconnections
         machine_f, _, tau_M = self.machine.f(psi_s, u_s, w_M)
         mechanics_f = self.mechanics.f(t, w_M, w_L, theta_ML, tau_M)
-        # List of state derivatives
+        # Tuple of state derivatives
         return machine_f + mechanics_f
 
     def save(self, sol):